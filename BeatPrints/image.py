@@ -8,14 +8,18 @@ import random
 import requests
 
 from io import BytesIO
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
 
 from Pylette import extract_colors
-from PIL import Image, ImageDraw, ImageEnhance
+from PIL import Image, ImageChops, ImageDraw, ImageEnhance, ImageOps
 
 from .consts import *
 
+# Shared session so image downloads reuse open connections.
+_SESSION = requests.Session()
+
 
 def get_palette(image: Image.Image) -> List[Tuple]:
     """
@@ -27,6 +31,10 @@ def get_palette(image: Image.Image) -> List[Tuple]:
     Returns:
         List[Tuple]: A list of RGB tuples representing the dominant colors.
     """
+    # Pylette shrinks images to 256x256 before extracting colors anyway, so
+    # do that first instead of encoding the full-size cover
+    image = image.resize((256, 256))
+
     with BytesIO() as byte_stream:
         # Save image to in-memory byte stream
         image.save(byte_stream, format="PNG")
@@ -67,7 +75,7 @@ def draw_palette(
 
 def crop(path: Path) -> Image.Image:
     """
-    Crops an image to a square aspect ratio.
+    Crops an image to a square aspect ratio and scales it to the cover size.
 
     Args:
         path (Path): The path to the image file.
@@ -78,23 +86,12 @@ def crop(path: Path) -> Image.Image:
     Raises:
         FileNotFoundError: If the file path does not exist.
     """
-
-    def chop(image: Image.Image) -> Image.Image:
-        width, height = image.size
-
-        # Get the smaller dimension for square cropping
-        min_dim = min(width, height)
-
-        # Define cropping box to center and crop the image to a square
-        left = (width - min_dim) / 2
-        top = (height - min_dim) / 2
-        right = (width + min_dim) / 2
-        bottom = (height + min_dim) / 2
-
-        return image.crop((left, top, right, bottom))
-
     with Image.open(path) as img:
-        return chop(img)
+        # Let JPEGs decode at a reduced scale that still covers the poster
+        img.draft("RGB", S_COVER)
+
+        # Center-crop and resample straight to the cover size in one pass
+        return ImageOps.fit(img, S_COVER, Image.Resampling.LANCZOS)
 
 
 def magicify(image: Image.Image) -> Image.Image:
@@ -117,6 +114,30 @@ def magicify(image: Image.Image) -> Image.Image:
     return contrast.enhance(0.8)
 
 
+@lru_cache(maxsize=32)
+def _fetch_scannable(item_type: str, id: str) -> bytes:
+    """
+    Downloads the PNG of a Spotify scannable code, fetching each code only once.
+
+    Args:
+        item_type (str): The Spotify item type ("track" or "album").
+        id (str): The Spotify track or album ID.
+
+    Returns:
+        bytes: The PNG data of the scannable code.
+
+    Raises:
+        requests.HTTPError: If the download fails, so the failure isn't cached.
+    """
+    # Construct the URL to fetch the scannable code from Spotify
+    scan_url = f"https://scannables.scdn.co/uri/plain/png/101010/white/1280/spotify:{item_type}:{id}"
+
+    response = _SESSION.get(scan_url)
+    response.raise_for_status()
+
+    return response.content
+
+
 def scannable(
     id: str, theme: THEME_OPTS = "Light", is_album: bool = False
 ) -> Image.Image:
@@ -135,25 +156,27 @@ def scannable(
     color = THEMES[theme]
     item_type = "album" if is_album else "track"
 
-    # Construct the URL to fetch the scannable code from Spotify
-    scan_url = f"https://scannables.scdn.co/uri/plain/png/101010/white/1280/spotify:{item_type}:{id}"
-
     # Fetch the scannable image data from Spotify
-    data = requests.get(scan_url).content
-    img_bytes = BytesIO(data)
+    img_bytes = BytesIO(_fetch_scannable(item_type, id))
 
     with Image.open(img_bytes) as scan_code:
-        # Convert to RGBA to support transparency
-        scan_code = scan_code.convert("RGBA")
-
-        pixels = scan_code.load()
-        width, height = scan_code.size
-
-        # Iterate through all pixels to replace white pixels with transparency
-        for x in range(width):
-            for y in range(height):
-                if pixels is not None:
-                    pixels[x, y] = CL_TRANSPARENT if pixels[x, y] != CL_WHITE else color
+        # Only sources with transparency need an alpha band to find white pixels
+        if "A" in scan_code.getbands() or "transparency" in scan_code.info:
+            scan_code = scan_code.convert("RGBA")
+        elif scan_code.mode != "RGB":
+            scan_code = scan_code.convert("RGB")
+
+        # Mask the pure white pixels, i.e. where every band is 255
+        bands = [
+            band.point(lambda v: 255 if v == 255 else 0) for band in scan_code.split()
+        ]
+        mask = bands[0]
+        for band in bands[1:]:
+            mask = ImageChops.multiply(mask, band)
+
+        # Paint white pixels in the theme color and make the rest transparent
+        scan_code = Image.new("RGBA", scan_code.size, CL_TRANSPARENT)
+        scan_code.paste(color, mask=mask)
 
         # Resize the image to a specific size
         return scan_code.resize(S_SPOTIFY_CODE, Image.Resampling.BICUBIC)
@@ -183,10 +206,11 @@ def cover(image_url: str, image_path: Optional[str]) -> Image.Image:
         img = crop(path)
 
     else:
-        img = Image.open(BytesIO(requests.get(image_url).content))
+        img = Image.open(BytesIO(_SESSION.get(image_url).content))
+        img = img.resize(S_COVER, Image.Resampling.LANCZOS)
 
-    # Apply the magic filter and resize the image for the cover
-    return magicify(img.resize(S_COVER))
+    # Apply the magic filter to the cover
+    return magicify(img)
 
 
 def get_theme(theme: THEME_OPTS = "Light") -> Tuple[tuple, str]:
@@ -16,6 +16,9 @@ from .errors import (
 )
 from .consts import T_INSTRUMENTAL
 
+# Matches a line selection in the "start-end" format.
+SELECTION_PATTERN = re.compile(r"^\d+-\d+$")
+
 
 class Lyrics:
     """
@@ -91,15 +94,12 @@ class Lyrics:
             LineLimitExceededError: If the selected range does not include exactly 4 lines.
         """
 
-        # Split lyrics into lines
-        lines = [line for line in lyrics.split("\n")]
-        line_count = len(lines)
+        # Count the lines without splitting the whole lyrics
+        line_count = lyrics.count("\n") + 1
 
         try:
-            pattern = r"^\d+-\d+$"
-
             # Check if selection matches the "start-end" format
-            if not re.match(pattern, selection):
+            if not SELECTION_PATTERN.match(selection):
                 raise InvalidFormatError
 
             selected = [int(num) for num in selection.split("-")]
@@ -113,8 +113,8 @@ class Lyrics:
             ):
                 raise InvalidSelectionError
 
-            # Extract the selected lines and remove empty lines
-            extracted = lines[selected[0] - 1 : selected[1]]
+            # Split only up to the selection, then remove empty lines
+            extracted = lyrics.split("\n", selected[1])[selected[0] - 1 : selected[1]]
             selected_lines = [line for line in extracted if line != ""]
 
             # Ensure exactly 4 lines are selected
@@ -7,7 +7,8 @@ Generates posters based on track or album information.
 import os
 
 from pathlib import Path
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Union
 
 from PIL import Image, ImageDraw
 
@@ -34,6 +35,32 @@ class Poster:
         """
         self.save_to = Path(save_to).expanduser().resolve()
 
+    def _fetch_images(
+        self,
+        metadata: Union[TrackMetadata, AlbumMetadata],
+        theme: THEME_OPTS,
+        custom_cover: Optional[str],
+        is_album: bool = False,
+    ) -> Tuple[Image.Image, Image.Image]:
+        """
+        Fetches the cover art and the Spotify scannable code concurrently.
+
+        Args:
+            metadata: Metadata containing the image URL and Spotify ID.
+            theme (str): The theme for the scannable code.
+            custom_cover (str, optional): Path to a custom cover image.
+            is_album (bool, optional): If True, fetches the album's scannable code.
+
+        Returns:
+            Tuple[Image.Image, Image.Image]: The cover art and the scannable code.
+        """
+        # Both are independent network/disk bound jobs, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cover = executor.submit(image.cover, metadata.image, custom_cover)
+            scannable = executor.submit(image.scannable, metadata.id, theme, is_album)
+
+            return cover.result(), scannable.result()
+
     def _add_common_text(
         self,
         draw: ImageDraw.ImageDraw,
@@ -107,8 +134,7 @@ class Poster:
         color, template = image.get_theme(theme)
 
         # Get cover art and spotify scannable code
-        cover = image.cover(metadata.image, custom_cover)
-        scannable = image.scannable(metadata.id, theme)
+        cover, scannable = self._fetch_images(metadata, theme, custom_cover)
 
         with Image.open(template) as poster:
             poster = poster.convert("RGB")
@@ -179,8 +205,9 @@ class Poster:
         color, template = image.get_theme(theme)
 
         # Get cover art and spotify scannable code
-        cover = image.cover(metadata.image, custom_cover)
-        scannable = image.scannable(metadata.id, theme, is_album=True)
+        cover, scannable = self._fetch_images(
+            metadata, theme, custom_cover, is_album=True
+        )
 
         with Image.open(template) as poster:
             poster = poster.convert("RGB")
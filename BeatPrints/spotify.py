@@ -8,8 +8,12 @@ import random
 import requests
 import datetime
 
-from typing import List
+from requests.adapters import HTTPAdapter
+
+from typing import Dict, List
+from functools import lru_cache
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 from .errors import NoMatchingTrackFound, NoMatchingAlbumFound, InvalidSearchLimit
 
@@ -61,6 +65,11 @@ class Spotify:
         self.CLIENT_ID = CLIENT_ID
         self.CLIENT_SECRET = CLIENT_SECRET
         self.__BASE_URL = "https://api.spotify.com/v1"
+
+        # Keep connections open across requests, enough for concurrent album fetches
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=8))
+
         self.__authorization_header()
 
     def __authorization_header(self) -> None:
@@ -77,15 +86,18 @@ class Spotify:
         }
 
         # Request token from Spotify API
-        data = requests.post(endpoint, headers=headers, params=payload)
+        data = self._session.post(endpoint, headers=headers, params=payload)
         token = data.json()["access_token"]
 
         # Store authorization header for use in API requests
         self.__AUTH_HEADER = {"Authorization": f"Bearer {token}"}
+        self._session.headers.update(self.__AUTH_HEADER)
 
-    def _format_release_date(self, release_date: str, precision: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _format_release_date(release_date: str, precision: str) -> str:
         """
-        Formats the release date of a track or album.
+        Formats the release date of a track or album, parsing each date only once.
 
         Args:
             release_date (str): Release date string from Spotify API.
@@ -117,6 +129,39 @@ class Spotify:
         seconds = (duration_ms // 1000) % 60
         return f"{minutes:02d}:{seconds:02d}"
 
+    def _get_albums(self, ids: List[str]) -> Dict[str, dict]:
+        """
+        Retrieves the full details of several albums in as few requests as possible.
+
+        Args:
+            ids (List[str]): Spotify IDs of the albums, duplicates are fetched once.
+
+        Returns:
+            Dict[str, dict]: The album details keyed by album ID.
+        """
+        ids = list(dict.fromkeys(ids))
+
+        # Spotify returns at most 20 albums per request
+        batches = [ids[i : i + 20] for i in range(0, len(ids), 20)]
+
+        def fetch(batch: List[str]) -> List[dict]:
+            params = {"ids": ",".join(batch)}
+            response = self._session.get(f"{self.__BASE_URL}/albums", params=params)
+            return response.json()["albums"]
+
+        # Searches of up to 20 results need a single request, so skip the pool
+        if len(batches) == 1:
+            albums = fetch(batches[0])
+
+        # Larger ones spend nearly all their time waiting, so run them side by side
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+                albums = [
+                    album for batch in executor.map(fetch, batches) for album in batch
+                ]
+
+        return dict(zip(ids, albums))
+
     def get_track(self, query: str, limit: int = 6) -> List[TrackMetadata]:
         """
         Searches for tracks based on a query and retrieves their metadata.
@@ -137,23 +182,19 @@ class Spotify:
 
         tracklist = []
         params = {"q": query, "type": "track", "limit": limit}
-        response = requests.get(
-            f"{self.__BASE_URL}/search", params=params, headers=self.__AUTH_HEADER
-        ).json()
+        response = self._session.get(f"{self.__BASE_URL}/search", params=params).json()
 
         tracks = response.get("tracks", {}).get("items", [])
 
         if not tracks:
             raise NoMatchingTrackFound
 
+        # Get every track's album up front using the album IDs
+        albums = self._get_albums([track["album"]["id"] for track in tracks])
+
         # Extract track details and format them
         for track in tracks:
-
-            # Get the track's album using the album ID
-            id = track["album"]["id"]
-            album = requests.get(
-                f"{self.__BASE_URL}/albums/{id}", headers=self.__AUTH_HEADER
-            ).json()
+            album = albums[track["album"]["id"]]
 
             # If the label name is too long, switch to the artist's name
             label = (
@@ -204,21 +245,19 @@ class Spotify:
 
         albumlist = []
         params = {"q": query, "type": "album", "limit": limit}
-        response = requests.get(
-            f"{self.__BASE_URL}/search", params=params, headers=self.__AUTH_HEADER
-        ).json()
+        response = self._session.get(f"{self.__BASE_URL}/search", params=params).json()
 
         albums = response.get("albums", {}).get("items", [])
 
         if not albums:
             raise NoMatchingAlbumFound
 
+        # Get every album's details up front for their tracklists
+        details = self._get_albums([album["id"] for album in albums])
+
         # Process each album to get details and tracklist
         for album in albums:
-            id = album["id"]
-            album_details = requests.get(
-                f"{self.__BASE_URL}/albums/{id}", headers=self.__AUTH_HEADER
-            ).json()
+            album_details = details[album["id"]]
 
             # Extract track names from album details
             tracks = [
@@ -6,10 +6,15 @@ Provides utility functions for Spotify and Lyrics operations.
 
 import re
 import random
-import string
 
 from . import write, consts
 
+# Characters that aren't allowed in filenames on common file systems.
+ILLEGAL_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1F\x7F]')
+
+# Runs of two or more underscores.
+REPEATED_UNDERSCORES = re.compile(r"_{2,}")
+
 
 def add_flat_indexes(nlist: list) -> list:
     """
@@ -46,6 +51,19 @@ def organize_tracks(tracks: list, indexing: bool = False) -> tuple:
             - List of widths for each track column.
     """
 
+    # Trim a copy, the caller's tracklist may be shared (e.g. cached search results)
+    tracks = list(tracks)
+
+    # Bind loop invariants to locals once instead of per retry
+    fonts = write.font("Light")
+    size = consts.S_TRACKS
+    max_rows = consts.MAX_ROWS
+    spacing = consts.S_SPACING
+    max_width = consts.MAX_WIDTH
+    text_width = write.calculate_text_width
+
+    measured = {}
+
     def calculate_column_width(tracks_column: list, additional_width: int = 0):
         """
         Helper function to calculate the width of the longest track in a column.
@@ -53,10 +71,11 @@ def organize_tracks(tracks: list, indexing: bool = False) -> tuple:
 
         tracks = max(tracks_column, key=len)
 
-        return (
-            write.calculate_text_width(tracks, write.font("Light"), consts.S_TRACKS)
-            + additional_width
-        )
+        # Retries only drop one track, so reuse widths measured before
+        if tracks not in measured:
+            measured[tracks] = text_width(tracks, fonts, size)
+
+        return measured[tracks] + additional_width
 
     additional_width = 0
 
@@ -64,31 +83,28 @@ def organize_tracks(tracks: list, indexing: bool = False) -> tuple:
     if indexing:
         index = len(tracks) + 1
 
-        additional_width = write.calculate_text_width(
-            f"{index}", write.font("Light"), consts.S_TRACKS
-        )
+        additional_width = text_width(f"{index}", fonts, size)
 
     while True:
-        # Split tracks into columns with a maximum of MAX_ROWS per column
-        columns = [
-            tracks[i : i + consts.MAX_ROWS]
-            for i in range(0, len(tracks), consts.MAX_ROWS)
-        ]
+        # Split tracks into columns with a maximum of max_rows per column
+        columns = [tracks[i : i + max_rows] for i in range(0, len(tracks), max_rows)]
 
         # Determine the width of each column
         track_widths = [
             calculate_column_width(col, additional_width) for col in columns
         ]
 
-        # Sum the total width and check if it fits within the allowed MAX_WIDTH
-        total_width = sum(track_widths) + consts.S_SPACING * (len(columns) - 1)
+        # Sum the total width and check if it fits within the allowed max_width
+        total_width = sum(track_widths) + spacing * (len(columns) - 1)
 
-        if total_width <= consts.MAX_WIDTH:
+        if total_width <= max_width:
             break  # If it fits, exit the loop
 
         else:
             # If it doesn't fit, remove the longest track from the column with the widest width
-            longest_column_index = track_widths.index(max(track_widths))
+            longest_column_index = max(
+                range(len(track_widths)), key=track_widths.__getitem__
+            )
             longest_column = columns[longest_column_index]
             tracks.remove(max(longest_column, key=len))
 
@@ -114,21 +130,17 @@ def filename(song: str, artist: str) -> str:
 
     # Replace illegal characters (e.g., "<", ":", "/") with underscores and sanitize the text
     safe_text = (
-        re.sub(r'[<>:"/\\|?*\x00-\x1F\x7F]', "_", full_text)
-        .strip()
-        .strip(".")
-        .lower()
-        .replace(" ", "_")
+        ILLEGAL_CHARS.sub("_", full_text).strip().strip(".").lower().replace(" ", "_")
     )
 
     # Remove consecutive underscores
-    safe_text = re.sub(r"_{2,}", "_", safe_text)
+    safe_text = REPEATED_UNDERSCORES.sub("_", safe_text)
 
     # Limit filename length to 255 characters (filesystem limit)
     safe_text = safe_text[:255]
 
     # Append 3 random hexadecimal digits to make the filename unique
-    random_hex = "".join(random.choices(string.hexdigits[:-6], k=3))
+    random_hex = f"{random.randrange(4096):03x}"
     filename = f"{safe_text}_{random_hex}.png"
 
     return filename
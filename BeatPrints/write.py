@@ -5,128 +5,232 @@ A custom module written to improve Pillow’s draw.text functionality.
 """
 
 import os
+import re
+import hashlib
 
+from functools import lru_cache
 from fontTools.ttLib import TTFont
 from PIL import ImageFont, ImageDraw
-from typing import Optional, Dict, Literal, Tuple, List
+from typing import Optional, Dict, FrozenSet, Literal, Tuple, List
 
 from .consts import P_FONTS
 
+# Common characters that are rendered with the last used font.
+COMMON_CHARS = frozenset(""" ,!@#$%^&*(){}[]+_=-""''?""")
 
-def _load_fonts(*font_paths: str) -> Dict[str, TTFont]:
+# Tag for characters that are rendered with the last used font.
+_FALLBACK = "\x7f"
+
+# Matches a run of identical font tags.
+_RUNS = re.compile(r"(.)\1*", re.DOTALL)
+
+# Font families in fallback order, the first one being the default.
+FONT_FAMILIES = (
+    "Oswald",
+    "NotoSansJP",
+    "NotoSansKR",
+    "NotoSansTC",
+    "NotoSansSC",
+    "NotoSans",
+)
+
+# Paths of every family's font file for each weight.
+_FONT_PATHS: Dict[str, Tuple[str, ...]] = {
+    weight: tuple(
+        os.path.join(P_FONTS, family, f"{family}-{weight}.ttf")
+        for family in FONT_FAMILIES
+    )
+    for weight in ("Regular", "Bold", "Light")
+}
+
+# Codepoints covered by each distinct cmap table, keyed by a digest of the table.
+# Every weight of a family ships the same table, so each one is only parsed once.
+_CMAPS: Dict[bytes, FrozenSet[int]] = {}
+
+
+def _read_cmap(path: str) -> FrozenSet[int]:
     """
-    Loads font files into memory and returns a dictionary of font objects.
+    Reads the set of codepoints a font file has glyphs for.
+
+    Args:
+        path (str): Path to the font file.
+
+    Returns:
+        frozenset: The codepoints covered by the font.
+    """
+    with TTFont(path, lazy=True) as font:
+        try:
+            # Key on a digest so the raw tables aren't kept alive
+            key = hashlib.blake2b(font.getTableData("cmap")).digest()
+
+            if key not in _CMAPS:
+                # Only the codepoints are needed, so skip deriving glyph names
+                glyphs = font["maxp"].numGlyphs
+                font.setGlyphOrder([f"glyph{gid:05d}" for gid in range(glyphs)])
+
+                _CMAPS[key] = frozenset(font.getBestCmap() or ())
+
+        except Exception:
+            # A font whose cmap can't be read doesn't cover any characters
+            return frozenset()
+
+    return _CMAPS[key]
+
+
+def _load_fonts(*font_paths: str) -> Dict[str, FrozenSet[int]]:
+    """
+    Reads the character coverage of font files without keeping them in memory.
 
     Args:
         *font_paths (str): Paths to font files.
 
     Returns:
-        dict: A dictionary mapping font paths to font objects.
+        dict: A dictionary mapping font paths to the codepoints they cover.
     """
     fonts = {}
     for path in font_paths:
-        font = TTFont(path)
-        fonts[path] = font
+        fonts[path] = _read_cmap(path)
     return fonts
 
 
-def font(weight: Literal["Regular", "Bold", "Light"]) -> Dict[str, TTFont]:
+@lru_cache(maxsize=3)
+def font(weight: Literal["Regular", "Bold", "Light"]) -> Dict[str, FrozenSet[int]]:
     """
     Loads fonts of the specified weight from the predefined assets/fonts directory.
 
+    The fonts are parsed once per weight and the same dictionary is returned on
+    every later call, so it must not be modified.
+
     Args:
         weight (str): The desired font weight ("Regular", "Bold", or "Light").
 
     Returns:
-        dict: A dictionary mapping font paths to font objects for the given weight.
+        dict: A dictionary mapping font paths to the codepoints they cover for the given weight.
+    """
+    return _load_fonts(*_FONT_PATHS[weight])
+
+
+@lru_cache(maxsize=64)
+def _get_pil_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Returns a Pillow font for the given path and size, loading it only once.
+
+    Call `_get_pil_font.cache_clear()` if the font files change on disk.
+
+    Args:
+        path (str): Path to the font file.
+        size (int): The font size.
+
+    Returns:
+        ImageFont.FreeTypeFont: The loaded font.
     """
-    fonts_path = P_FONTS
-    font_families = [
-        "Oswald",
-        "NotoSansJP",
-        "NotoSansKR",
-        "NotoSansTC",
-        "NotoSansSC",
-        "NotoSans",
-    ]
-    font_paths = [
-        os.path.join(fonts_path, family, f"{family}-{weight}.ttf")
-        for family in font_families
-    ]
-    return _load_fonts(*font_paths)
-
-
-def _check_glyph(font: TTFont, glyph: str) -> bool:
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=4096)
+def _get_length(path: str, size: int, text: str) -> float:
     """
-    Checks if a specific glyph exists in the given font.
+    Returns the advance width of the text in the given font, measuring it only once.
 
     Args:
-        font (TTFont): The font to check.
-        glyph (str): The character (glyph) to search for.
+        path (str): Path to the font file.
+        size (int): The font size.
+        text (str): The text to measure.
 
     Returns:
-        bool: True if the glyph exists in the font, False otherwise.
+        float: The advance width of the text.
     """
-    try:
-        cmap = font.getBestCmap()
-        return ord(glyph) in cmap
+    return _get_pil_font(path, size).getlength(text)
 
-    except Exception:
-        return False
 
+class _FontTable(dict):
+    """
+    A `str.translate` table that tags each codepoint with the index of the font
+    that renders it, resolving each codepoint the first time it's looked up.
+    """
 
-def group_by_font(text: str, fonts: Dict[str, TTFont]) -> List[List[str]]:
+    def __init__(self, fonts: Dict[str, FrozenSet[int]]):
+        super().__init__()
+        self.cmaps = list(fonts.values())
+
+        # Whether ASCII text always renders entirely with the default font.
+        # NUL is left out since some fallback fonts map it to a glyph.
+        self.ascii = all(self[c] in ("\x00", _FALLBACK) for c in range(1, 128))
+
+    def __missing__(self, codepoint: int) -> str:
+        tag = _FALLBACK
+
+        # Line breaks start over with the default font, common characters keep
+        # the last used font, others use the first font that supports them.
+        if codepoint == 10:
+            tag = "\x00"
+        elif chr(codepoint) not in COMMON_CHARS:
+            for index, cmap in enumerate(self.cmaps):
+                if codepoint in cmap:
+                    tag = chr(index)
+                    break
+
+        self[codepoint] = tag
+        return tag
+
+
+# Translation tables for each set of fonts, keyed by their paths.
+_TABLES: Dict[Tuple[str, ...], _FontTable] = {}
+
+
+def group_by_font(text: str, fonts: Dict[str, FrozenSet[int]]) -> List[Tuple[str, str]]:
     """
     Groups consecutive characters in a string based on the font required to render them.
 
     Args:
         text (str): The text to be grouped by font.
-        fonts (dict): A dictionary mapping font paths to font objects.
+        fonts (dict): A dictionary mapping font paths to the codepoints they cover.
 
     Returns:
-        list: A list of lists, where each sublist contains a group of characters
+        list: A list of tuples, where each tuple contains a group of characters
               and their corresponding font path.
     """
-    groups = []
+    if not text:
+        return []
+
+    font_paths = tuple(fonts)
 
-    # Common characters to render with the default font.
-    common_chars = """ ,!@#$%^&*(){}[]+_=-""''?"""
+    table = _TABLES.get(font_paths)
+    if table is None:
+        table = _TABLES[font_paths] = _FontTable(fonts)
 
     # Use the first font in the dictionary as the default font.
-    default_font = next(iter(fonts))
-    last_font_path = default_font
+    last_font_path = font_paths[0]
 
-    # Assign each character to the correct font.
-    for char in text:
-        char_matched = False
+    # ASCII text needs no classification when the default font covers it.
+    if table.ascii and text.isascii() and "\x00" not in text:
+        return [(text, last_font_path)]
 
-        # Use the default font for common characters.
-        if char in common_chars:
-            groups.append([char, last_font_path])
-            continue
+    # Tag every character with its font in one pass, then walk the runs.
+    tags = text.translate(table)
 
-        # Check which font supports the character.
-        for font_path, font in fonts.items():
-            if _check_glyph(font, char):
-                last_font_path = font_path
-                groups.append([char, font_path])
-                char_matched = True
-                break
+    # Text the default font covers entirely needs no run splitting at all.
+    if not tags.strip("\x00" + _FALLBACK):
+        return [(text, last_font_path)]
 
-        # If no font matches, assign the last used font.
-        if not char_matched:
-            groups.append([char, last_font_path])
+    merged = []
+    start = 0
 
-    # Merge consecutive characters that use the same font into one group.
-    merged = [groups[0]]
-    for char, font_path in groups[1:]:
+    for run in _RUNS.finditer(tags):
+        tag = run.group(1)
 
-        # Append the character to the current group.
-        if merged[-1][1] == font_path:
-            merged[-1][0] += char
-        else:
-            merged.append([char, font_path])
+        # Characters no font claims are rendered with the last used font.
+        if tag == _FALLBACK or font_paths[ord(tag)] == last_font_path:
+            continue
 
+        # Groups are contiguous, so close the current one where the font changes.
+        if run.start():
+            merged.append((text[start : run.start()], last_font_path))
+
+        start = run.start()
+        last_font_path = font_paths[ord(tag)]
+
+    merged.append((text[start:], last_font_path))
     return merged
 
 
@@ -135,7 +239,7 @@ def render_singleline(
     pos: Tuple[int, int],
     text: str,
     color: Tuple[int, int, int],
-    fonts: Dict[str, TTFont],
+    fonts: Dict[str, FrozenSet[int]],
     size: int,
     anchor: Optional[str] = None,
     align: Literal["left", "center", "right"] = "left",
@@ -153,24 +257,43 @@ def render_singleline(
         anchor (str, optional): Text anchor for alignment.
         align (str, optional): Text alignment ("left", "center", "right").
     """
-    offset = 0
-    formatted_text = group_by_font(text, fonts)
+    _render_runs(draw, pos, group_by_font(text, fonts), color, size, anchor, align)
 
-    x, y = pos
 
-    # Render each character
-    for char, font_path in formatted_text:
-        font = ImageFont.truetype(font_path, size)
+def _render_runs(
+    draw: ImageDraw.ImageDraw,
+    pos: Tuple[int, int],
+    runs: List[Tuple[str, str]],
+    color: Tuple[int, int, int],
+    size: int,
+    anchor: Optional[str] = None,
+    align: Literal["left", "center", "right"] = "left",
+) -> None:
+    """
+    Renders a single line of text that has already been grouped by font.
+
+    Args:
+        draw (ImageDraw.ImageDraw): The drawing context.
+        pos (tuple): The (x, y) position to start drawing.
+        runs (list): The groups of characters and their font paths.
+        color (tuple): The text color in RGB format.
+        size (int): The font size.
+        anchor (str, optional): Text anchor for alignment.
+        align (str, optional): Text alignment ("left", "center", "right").
+    """
+    offset = 0
+    x, y = pos
 
-        # Get char bounding box
-        char_box = font.getbbox(char)
+    # Render each run of characters sharing a font in a single call
+    for chunk, font_path in runs:
+        font = _get_pil_font(font_path, size)
 
-        # Position for char
-        char_pos = (x + offset, y)
+        # Position for chunk
+        chunk_pos = (x + offset, y)
 
         draw.text(
-            xy=char_pos,
-            text=char,
+            xy=chunk_pos,
+            text=chunk,
             fill=color,
             font=font,
             anchor=anchor,
@@ -178,11 +301,37 @@ def render_singleline(
             embedded_color=True,
         )
 
-        # Update offset for next char
-        offset += char_box[2] - char_box[0]
+        # Advance by the chunk's advance width, which keeps side bearings
+        # and trailing spaces that a bounding box would drop
+        offset += _get_length(font_path, size, chunk)
 
 
-def calculate_text_width(text: str, fonts: Dict[str, TTFont], size: int) -> int:
+def _split_lines(runs: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    """
+    Splits grouped text at its line breaks.
+
+    Args:
+        runs (list): The groups of characters and their font paths.
+
+    Returns:
+        list: The groups of each line, in order.
+    """
+    lines = [[]]
+
+    for chunk, font_path in runs:
+        parts = chunk.split("\n")
+
+        # Every line break inside a chunk closes the current line
+        for index, part in enumerate(parts):
+            if index:
+                lines.append([])
+            if part:
+                lines[-1].append((part, font_path))
+
+    return lines
+
+
+def calculate_text_width(text: str, fonts: Dict[str, FrozenSet[int]], size: int) -> int:
     """
     Returns the width of the text without drawing it.
 
@@ -194,19 +343,10 @@ def calculate_text_width(text: str, fonts: Dict[str, TTFont], size: int) -> int:
     Returns:
         int: The width of the text.
     """
-    total_width = 0
-
-    # Group text by font
-    formatted_text = group_by_font(text, fonts)
-
-    # Sum widths of all words
-    for word, path in formatted_text:
-        font = ImageFont.truetype(path, size)
-
-        # Add word width
-        total_width += font.getlength(word)
-
-    return int(total_width)
+    # Sum the cached widths of the text's font groups in a single pass
+    return int(
+        sum(_get_length(path, size, word) for word, path in group_by_font(text, fonts))
+    )
 
 
 def text(
@@ -214,7 +354,7 @@ def text(
     pos: Tuple[int, int],
     text: str,
     color: Tuple[int, int, int],
-    fonts: Dict[str, TTFont],
+    fonts: Dict[str, FrozenSet[int]],
     size: int,
     anchor: Optional[str] = None,
     spacing: int = 0,
@@ -234,23 +374,21 @@ def text(
         spacing (int, optional): Vertical spacing between lines.
         align (str, optional): Text alignment ("left", "center", "right").
     """
-    x, y = pos
+    runs = group_by_font(text, fonts)
 
-    # Choose multiline function if text has line breaks
-    if "\n" in text:
-        y_offset = 0
-        lines = text.split("\n")
-        scale = int(round((size * 6) / 42, 1))
+    # Draw a single line as is
+    if "\n" not in text:
+        _render_runs(draw, pos, runs, color, size, anchor, align)
+        return
 
-        # Call render_singleline drawing for each line
-        for line in lines:
-            render_singleline(
-                draw, (x, y + y_offset), line, color, fonts, size, anchor, align
-            )
-            y_offset += size + scale + spacing
-    else:
-        # Draw a single line
-        render_singleline(draw, pos, text, color, fonts, size, anchor, align)
+    x, y = pos
+    y_offset = 0
+    line_height = size + int(round((size * 6) / 42, 1)) + spacing
+
+    # Draw the grouped text line by line
+    for line in _split_lines(runs):
+        _render_runs(draw, (x, y + y_offset), line, color, size, anchor, align)
+        y_offset += line_height
 
 
 def heading(
@@ -259,7 +397,7 @@ def heading(
     max_width: int,
     text: str,
     color: Tuple[int, int, int],
-    fonts: Dict[str, TTFont],
+    fonts: Dict[str, FrozenSet[int]],
     size: int,
 ) -> None:
     """
@@ -274,22 +412,35 @@ def heading(
         fonts (dict): A dictionary of fonts to use.
         size (int): The font size.
     """
-    total_width = 0
-
     # Pair words with corresponding fonts.
     words_fonts = group_by_font(text, fonts)
 
-    # Adjust font size to fit within max_width.
-    while True:
-        for word, font_path in words_fonts:
-            font = ImageFont.truetype(font_path, size)
-            total_width += font.getlength(word)
+    # Only the total width matters while fitting, so measure each font's
+    # text in one call no matter how many groups it's split across.
+    texts_by_font: Dict[str, str] = {}
+    for word, path in words_fonts:
+        texts_by_font[path] = texts_by_font.get(path, "") + word
+
+    def total_width(size: int) -> float:
+        """
+        Helper function to calculate the width of the heading at a font size.
+        """
+        return sum(
+            _get_length(path, size, words) for path, words in texts_by_font.items()
+        )
+
+    # Widths scale almost linearly with the size, so estimate the largest
+    # fitting size from the overflow and only correct it by a step or two.
+    width = total_width(size)
+    if width > max_width:
+        fitted = max(1, min(size - 1, int(size * max_width / width)))
+
+        while fitted < size - 1 and total_width(fitted + 1) <= max_width:
+            fitted += 1
+        while fitted > 1 and total_width(fitted) > max_width:
+            fitted -= 1
 
-        if total_width > max_width:
-            size -= 1  # Reduce font size.
-            total_width = 0
-        else:
-            break
+        size = fitted
 
     offset = 0
 
@@ -297,7 +448,7 @@ def heading(
     for word, font_path in words_fonts:
         word_pos = (pos[0] + offset, pos[1])
 
-        font = ImageFont.truetype(font_path, size)
+        font = _get_pil_font(font_path, size)
         draw.text(
             xy=word_pos,
             text=word,
@@ -307,6 +458,5 @@ def heading(
             embedded_color=True,
         )
 
-        # Update offset based on word width.
-        word_width = font.getbbox(word)[2]
-        offset += word_width
+        # Update offset based on the word's advance width.
+        offset += _get_length(font_path, size, word)
@@ -3,6 +3,9 @@ import toml
 import platform
 from rich import print
 
+from typing import Any
+from functools import lru_cache
+
 # Determine the config directory path based on the platform
 config_dir = (
     os.getenv("APPDATA")
@@ -13,17 +16,38 @@ config_dir = (
 # Set the full path to the BeatPrints configuration file
 config_path = os.path.join(str(config_dir), "BeatPrints", "config.toml")
 
-# Attempt to load the configuration file
-try:
-    with open(config_path) as config:
-        config = toml.load(config)
+# The configuration needed, mapped to its section and key in the file
+SETTINGS = {
+    "POSTERS_DIR": ("general", "output_directory"),
+    "SEARCH_LIMIT": ("general", "search_limit"),
+    "CLIENT_ID": ("credentials", "client_id"),
+    "CLIENT_SECRET": ("credentials", "client_secret"),
+}
+
+
+@lru_cache(maxsize=1)
+def load() -> dict:
+    """
+    Loads the configuration file, parsing it only the first time it's needed.
+    """
+    # Attempt to load the configuration file
+    try:
+        with open(config_path) as config:
+            return toml.load(config)
+
+    except FileNotFoundError:
+        print(
+            "The config file for BeatPrints doesn't exist. Please create one properly."
+        )
+        exit(1)
+
 
-    # Grab the configuration needed
-    POSTERS_DIR = config["general"]["output_directory"]
-    SEARCH_LIMIT = config["general"]["search_limit"]
-    CLIENT_ID = config["credentials"]["client_id"]
-    CLIENT_SECRET = config["credentials"]["client_secret"]
+def __getattr__(name: str) -> Any:
+    """
+    Resolves settings such as `conf.POSTERS_DIR` from the configuration file on first use.
+    """
+    if name not in SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-except FileNotFoundError:
-    print("The config file for BeatPrints doesn't exist. Please create one properly.")
-    exit(1)
+    section, key = SETTINGS[name]
+    return load()[section][key]
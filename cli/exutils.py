@@ -1,12 +1,20 @@
+from __future__ import annotations
+
 import os
+import sys
+
+from functools import lru_cache
+from operator import attrgetter
 
 from rich import box
 from rich.table import Table
 
 from questionary import Style
-from typing import List, Literal, Union
+from typing import List, Literal, Union, TYPE_CHECKING
 
-from BeatPrints import spotify
+# Only needed for annotations, importing BeatPrints here would load all of it
+if TYPE_CHECKING:
+    from BeatPrints import spotify
 
 lavish = Style(
     [
@@ -18,25 +26,96 @@ lavish = Style(
     ]
 )
 
-BEATPRINTS_ASCII = """
-██████╗ ███████╗ █████╗ ████████╗██████╗ ██████╗ ██╗███╗   ██╗████████╗███████╗
-██╔══██╗██╔════╝██╔══██╗╚══██╔══╝██╔══██╗██╔══██╗██║████╗  ██║╚══██╔══╝██╔════╝
-██████╔╝█████╗  ███████║   ██║   ██████╔╝██████╔╝██║██╔██╗ ██║   ██║   ███████╗
-██╔══██╗██╔══╝  ██╔══██║   ██║   ██╔═══╝ ██╔══██╗██║██║╚██╗██║   ██║   ╚════██║
-██████╔╝███████╗██║  ██║   ██║   ██║     ██║  ██║██║██║ ╚████║   ██║   ███████║
-╚═════╝ ╚══════╝╚═╝  ╚═╝   ╚═╝   ╚═╝     ╚═╝  ╚═╝╚═╝╚═╝  ╚═══╝   ╚═╝   ╚══════╝
+# Moves the cursor home and erases the screen and scrollback, so clearing and
+# printing the banner takes one write instead of spawning `clear`.
+CLEAR_SEQUENCE = b"\x1b[H\x1b[2J\x1b[3J"
+
+# The banner lives in a data file next to this module
+BANNER_PATH = os.path.join(os.path.dirname(__file__), "banner.txt")
+
+
+@lru_cache(maxsize=1)
+def banner() -> bytes:
+    """
+    Reads the BeatPrints banner the first time the screen is cleared.
+
+    Returns:
+        bytes: The UTF-8 encoded banner.
+    """
+    with open(BANNER_PATH, "rb") as file:
+        return file.read()
+
+
+def enable_vt() -> bool:
+    """
+    Turns on escape sequence processing for the Windows console.
+
+    Returns:
+        bool: True if the terminal understands escape sequences.
+    """
+    if os.name != "nt":
+        return True
+
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)
+    mode = ctypes.c_ulong()
+
+    # ENABLE_VIRTUAL_TERMINAL_PROCESSING, available since Windows 10
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return False
 
-🥰 Create pinterest-style music posters that stand out, for FREE! by @TrueMyst
--------------------------------------------------------------------------------
-"""
+    return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+
+
+VT_ENABLED = enable_vt()
+
+# Clearing only makes sense when the output is shown in a terminal
+IS_TTY = sys.stdout.isatty()
 
 
 def clear() -> None:
     """
     Clears the terminal screen.
     """
-    os.system("cls" if os.name == "nt" else "clear")
-    print(BEATPRINTS_ASCII)
+    # Don't write the clear sequence and banner into pipes or files
+    if not IS_TTY:
+        return
+
+    # Consoles without escape sequence support still need `cls`
+    if not VT_ENABLED:
+        os.system("cls")
+        print(banner().decode("utf-8"))
+        return
+
+    # Flush pending text first so it isn't written after the banner
+    sys.stdout.flush()
+
+    screen = CLEAR_SEQUENCE + banner() + b"\n"
+
+    # Replaced streams (e.g. in IDEs) may be text-only
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(screen.decode("utf-8"))
+        sys.stdout.flush()
+        return
+
+    buffer.write(screen)
+    buffer.flush()
+
+
+# Extra columns (header, justify, style) and row fields for each kind of result
+TABLE_SCHEMA = {
+    "track": (
+        (("Artist", "right", "blue"), ("Album", "left", "cyan")),
+        attrgetter("name", "artist", "album"),
+    ),
+    "album": (
+        (("Artist", "right", "blue"), ("Year", "left", "cyan")),
+        attrgetter("name", "artist", "released"),
+    ),
+}
 
 
 def tablize_items(
@@ -47,24 +126,24 @@ def tablize_items(
     Creates a pretty table for displaying either track or album search results.
 
     Args:
+        items (list): The tracks or albums found by the search.
+        item_type (str): The kind of items ("track" or "album").
+
+    Returns:
+        Table: A rich table listing the items.
     """
+    columns, row = TABLE_SCHEMA[item_type]
+
     table = Table(box=box.ROUNDED)
     table.add_column("*", justify="center", style="magenta")
     table.add_column("Title", style="green")
 
-    if item_type == "track":
-        table.add_column("Artist", justify="right", style="blue")
-        table.add_column("Album", justify="left", style="cyan")
+    for header, justify, style in columns:
+        table.add_column(header, justify=justify, style=style)
 
-        for pos, item in enumerate(items, start=1):
-            table.add_row(f"{pos}", item.name, item.artist, item.album)
-
-    elif item_type == "album":
-        table.add_column("Artist", justify="right", style="blue")
-        table.add_column("Year", justify="left", style="cyan")
-
-        for pos, item in enumerate(items, start=1):
-            table.add_row(f"{pos}", item.name, item.artist, item.released)
+    # Fetch each row's fields in a single call
+    for pos, item in enumerate(items, start=1):
+        table.add_row(str(pos), *row(item))
 
     return table
 
@@ -85,17 +164,11 @@ def format_lyrics(
         None: If the lyrics are None.
     """
     if lyrics is not None:
-        # Split the lyrics into lines
-        lines = lyrics.splitlines()
-
-        # Format the lines
-        formatted_lines = [
-            f"[bold magenta]{ln:2}[/bold magenta] {line}"
-            for ln, line in enumerate(lines, start=1)
-        ]
-
-        # Join formatted lines into a single string
-        improved_lyrics = "\n".join(formatted_lines)
+        # Number each line and join them into a single string
+        improved_lyrics = "\n".join(
+            "[bold magenta]%2d[/bold magenta] %s" % (ln, line)
+            for ln, line in enumerate(lyrics.splitlines(), start=1)
+        )
 
         # Create and format the table
         table = Table(box=box.ROUNDED)
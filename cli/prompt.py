@@ -1,14 +1,73 @@
+from __future__ import annotations
+
+import random
 import questionary
 
-from rich import print
+from rich import get_console
+
+from functools import lru_cache
+from dataclasses import replace
+from typing import Tuple, TYPE_CHECKING
 
 from cli import conf, exutils, validate
-from BeatPrints import lyrics, spotify, poster, errors
 
-# Initialize components
-ly = lyrics.Lyrics()
-ps = poster.Poster(conf.POSTERS_DIR)
-sp = spotify.Spotify(conf.CLIENT_ID, conf.CLIENT_SECRET)
+# Print through the console directly instead of going through rich's print
+console = get_console()
+print = console.print
+
+# BeatPrints pulls in Pillow, fontTools and Pylette, so it's only imported once
+# the prompts actually need it rather than before the first one is shown.
+if TYPE_CHECKING:
+    from BeatPrints import lyrics, spotify, poster
+
+
+@lru_cache(maxsize=1)
+def initialize() -> Tuple[lyrics.Lyrics, poster.Poster, spotify.Spotify]:
+    """
+    Initializes the components the first time they're needed, rather than on import.
+
+    Returns:
+        tuple: The lyrics, poster and Spotify clients.
+    """
+    from BeatPrints import lyrics, spotify, poster
+
+    ly = lyrics.Lyrics()
+    ps = poster.Poster(conf.POSTERS_DIR)
+    sp = spotify.Spotify(conf.CLIENT_ID, conf.CLIENT_SECRET)
+
+    return ly, ps, sp
+
+
+@lru_cache(maxsize=32)
+def search_tracks(query: str, limit: int) -> list:
+    """
+    Searches for tracks, reusing the results when the same search is repeated.
+
+    Args:
+        query (str): The track to search for.
+        limit (int): Max search results.
+
+    Returns:
+        list: The matching tracks.
+    """
+    _, _, sp = initialize()
+    return sp.get_track(query, limit=limit)
+
+
+@lru_cache(maxsize=32)
+def search_albums(query: str, limit: int) -> list:
+    """
+    Searches for albums, reusing the results when the same search is repeated.
+
+    Args:
+        query (str): The album to search for.
+        limit (int): Max search results.
+
+    Returns:
+        list: The matching albums, with their tracklists in order.
+    """
+    _, _, sp = initialize()
+    return sp.get_album(query, limit)
 
 
 def select_track(limit: int):
@@ -31,7 +90,7 @@ def select_track(limit: int):
             qmark="🎺",
         ).unsafe_ask()
 
-        result = sp.get_track(query, limit=limit)
+        result = search_tracks(query, limit)
 
         # Clear the screen
         exutils.clear()
@@ -90,7 +149,14 @@ def select_album(limit: int):
             qmark="💿️",
         ).unsafe_ask()
 
-        result = sp.get_album(query, limit, shuffle)
+        result = search_albums(query, limit)
+
+        # Shuffle copies, so every search gets a new order and the cache stays intact
+        if shuffle:
+            result = [
+                replace(album, tracks=random.sample(album.tracks, len(album.tracks)))
+                for album in result
+            ]
 
         # Clear the screen
         exutils.clear()
@@ -130,6 +196,10 @@ def handle_lyrics(track: spotify.TrackMetadata):
     Returns:
         str: Selected lyrics portion.
     """
+    from BeatPrints import errors
+
+    ly, _, _ = initialize()
+
     try:
         # Fetch lyrics and print it in a pretty table
         lyrics = ly.get_lyrics(track)
@@ -168,12 +238,19 @@ def handle_lyrics(track: spotify.TrackMetadata):
 
 def poster_features():
     """
-    Ask for poster customization options.
+    Ask for the poster type and customization options.
 
     Returns:
-        tuple: theme, accent color, and image path.
+        tuple: poster type, theme, accent color, and image path.
     """
+    # Ask everything up front in a single form
     features = questionary.form(
+        poster_type=questionary.select(
+            "• What do you want to create?",
+            choices=["Track Poster", "Album Poster"],
+            style=exutils.lavish,
+            qmark="🎨",
+        ),
         theme=questionary.select(
             "• Which theme do you prefer?",
             choices=[
@@ -203,7 +280,7 @@ def poster_features():
         ),
     ).unsafe_ask()
 
-    theme, accent, image = features.values()
+    poster_type, theme, accent, image = features.values()
 
     # Get the image path if custom image is selected
     image_path = (
@@ -217,24 +294,15 @@ def poster_features():
         .unsafe_ask()
     )
 
-    return theme, accent, image_path
+    return poster_type, theme, accent, image_path
 
 
 def create_poster():
     """
     Create a poster based on user input.
     """
-    poster_type = questionary.select(
-        "• What do you want to create?",
-        choices=["Track Poster", "Album Poster"],
-        style=exutils.lavish,
-        qmark="🎨",
-    ).unsafe_ask()
-
-    theme, accent, image = poster_features()
-
-    # Clear the screen
-    exutils.clear()
+    poster_type, theme, accent, image = poster_features()
+    _, ps, _ = initialize()
 
     # Generate posters
     if poster_type == "Track Poster":